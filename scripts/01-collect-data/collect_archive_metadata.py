@@ -100,7 +100,7 @@ class ArchiveMetadataCollector:
         self.logger.handlers.clear()
         
         # File handler
-        file_handler = logging.FileHandler(log_file)
+        file_handler = logging.FileHandler(log_file, delay=True)
         file_handler.setLevel(logging.DEBUG)
         
         # Console handler
@@ -511,9 +511,10 @@ class ArchiveMetadataCollector:
             return
         
         # Initialize progress
+        started_at = datetime.now().isoformat()
         self.progress = ProgressState(
-            collection_started=datetime.now().isoformat(),
-            last_updated=datetime.now().isoformat(),
+            collection_started=started_at,
+            last_updated=started_at,
             status="in_progress",
             total_recordings=total_recordings,
             processed_recordings=0,
@@ -97,7 +97,7 @@ class CompleteShowCollector:
         self.logger.handlers.clear()
         
         # File handler
-        file_handler = logging.FileHandler(log_file)
+        file_handler = logging.FileHandler(log_file, delay=True)
         file_handler.setLevel(logging.DEBUG)
         
         # Console handler
@@ -27,7 +27,7 @@ Usage:
 import json
 import os
 import sys
-from datetime import datetime
+import time
 from pathlib import Path
 from typing import Dict, List, Optional
 import argparse
@@ -232,7 +232,7 @@ class ArchiveRecordingsProcessor:
     
     def process_recordings(self, output_dir: str = "stage02-generated-data"):
         """Process recordings from cached data."""
-        start_time = datetime.now()
+        start_time = time.perf_counter()
         
         # Load cached recordings
         recordings = self.load_cached_recordings()
@@ -244,7 +244,7 @@ class ArchiveRecordingsProcessor:
         self.save_individual_recordings(recordings, output_dir)
         
         # Report processing time
-        processing_time = (datetime.now() - start_time).total_seconds()
+        processing_time = time.perf_counter() - start_time
         self.logger.info(f"✅ Processing completed in {processing_time:.1f} seconds")
         
         # Summary
@@ -25,6 +25,7 @@ Usage:
 import json
 import os
 import sys
+import time
 from datetime import datetime
 from pathlib import Path
 from collections import defaultdict
@@ -314,7 +315,7 @@ class RecordingRatingsGenerator:
     
     def process_all_ratings(self) -> bool:
         """Process all rating statistics from cached data."""
-        start_time = datetime.now()
+        start_time = time.perf_counter()
         
         # Load cached recordings
         recordings = self.load_cached_recordings()
@@ -332,7 +333,7 @@ class RecordingRatingsGenerator:
         self.generate_ratings_json(recording_ratings, show_ratings)
         
         # Report processing time
-        processing_time = (datetime.now() - start_time).total_seconds()
+        processing_time = time.perf_counter() - start_time
         self.logger.info(f"✅ Processing completed in {processing_time:.1f} seconds")
         
         # Summary
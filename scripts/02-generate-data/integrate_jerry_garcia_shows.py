@@ -24,7 +24,9 @@ Usage:
 
 import json
 import os
+import re
 import sys
+import time
 from datetime import datetime
 from pathlib import Path
 from collections import defaultdict
@@ -37,6 +39,33 @@ sys.path.append(str(Path(__file__).parent.parent))
 from shared.models import RecordingMetadata
 from shared.recording_utils import improve_source_type_detection, detect_recording_time, normalize_venue_name, calculate_venue_similarity
 
+# Show ID component normalization pattern, compiled once
+_NON_WORD_RE = re.compile(r'[^\w]+')
+
+# US state codes for venue location fixes
+US_STATE_CODES = frozenset({
+    "AL", "AK", "AZ", "AR", "CA", "CO", "CT", "DE", "FL", "GA",
+    "HI", "ID", "IL", "IN", "IA", "KS", "KY", "LA", "ME", "MD",
+    "MA", "MI", "MN", "MS", "MO", "MT", "NE", "NV", "NH", "NJ",
+    "NM", "NY", "NC", "ND", "OH", "OK", "OR", "PA", "RI", "SC",
+    "SD", "TN", "TX", "UT", "VT", "VA", "WA", "WV", "WI", "WY"
+})
+
+# Canadian province names (and known misspellings) to 2-letter codes
+CANADIAN_PROVINCES = {
+    "British Columbia": "BC", "Ontario": "ON", "Manitoba": "MB",
+    "Manatoba": "MB",  # Fix spelling error
+    "Alberta": "AB", "Saskatchewan": "SK", "Quebec": "QC",
+    "Newfoundland": "NL", "New Brunswick": "NB", "Nova Scotia": "NS",
+    "Prince Edward Island": "PE", "Yukon": "YT", "Northwest Territories": "NT",
+    "Nunavut": "NU"
+}
+
+# Countries that show up in the state field of international venues
+COUNTRIES_IN_STATE_FIELD = frozenset({
+    "Netherlands", "Luxembourg", "France", "England", "Egypt", "Denmark"
+})
+
 
 class JerryGarciaShowIntegrator:
     """
@@ -225,14 +254,10 @@ class JerryGarciaShowIntegrator:
                 return ""
             # Convert to lowercase
             normalized = text.lower()
-            # Replace spaces and special characters with hyphens
-            import re
-            normalized = re.sub(r'[^\w]+', '-', normalized)
+            # Replace each run of spaces, hyphens and special characters with one hyphen
+            normalized = _NON_WORD_RE.sub('-', normalized)
             # Remove leading/trailing hyphens
-            normalized = normalized.strip('-')
-            # Replace multiple consecutive hyphens with single hyphen
-            normalized = re.sub(r'-+', '-', normalized)
-            return normalized
+            return normalized.strip('-')
         
         # Normalize all components
         components = [
@@ -280,22 +305,14 @@ class JerryGarciaShowIntegrator:
         # Fix 2: US venues with state code in country field  
         if (state == "" or state is None) and country and len(country) == 2:
             # Likely a US state code in the country field
-            if country.upper() in ["AL", "AK", "AZ", "AR", "CA", "CO", "CT", "DE", "FL", "GA", 
-                                  "HI", "ID", "IL", "IN", "IA", "KS", "KY", "LA", "ME", "MD",
-                                  "MA", "MI", "MN", "MS", "MO", "MT", "NE", "NV", "NH", "NJ",
-                                  "NM", "NY", "NC", "ND", "OH", "OK", "OR", "PA", "RI", "SC",
-                                  "SD", "TN", "TX", "UT", "VT", "VA", "WA", "WV", "WI", "WY"]:
+            if country.upper() in US_STATE_CODES:
                 show_data["state"] = country.upper()
                 show_data["country"] = "USA"
                 self.logger.debug(f"Fixed state field for {venue}: moved '{country}' from country to state, set country to 'USA'")
         
         # Fix 3: US venues with state code duplicated in country field (e.g., World Music Theater)
         if (state and country == state and len(country) == 2 and 
-            country.upper() in ["AL", "AK", "AZ", "AR", "CA", "CO", "CT", "DE", "FL", "GA", 
-                               "HI", "ID", "IL", "IN", "IA", "KS", "KY", "LA", "ME", "MD",
-                               "MA", "MI", "MN", "MS", "MO", "MT", "NE", "NV", "NH", "NJ",
-                               "NM", "NY", "NC", "ND", "OH", "OK", "OR", "PA", "RI", "SC",
-                               "SD", "TN", "TX", "UT", "VT", "VA", "WA", "WV", "WI", "WY"]):
+            country.upper() in US_STATE_CODES):
             show_data["country"] = "USA"
             # Also fix location_raw if it has duplicate state codes
             location_raw = show_data.get("location_raw", "")
@@ -315,16 +332,8 @@ class JerryGarciaShowIntegrator:
             self.logger.debug(f"Fixed Canadian venue for {venue}: set state to 'BC', country to 'Canada'")
         
         # Fix 5: Canadian province standardization (comprehensive)
-        canadian_provinces = {
-            "British Columbia": "BC", "Ontario": "ON", "Manitoba": "MB", 
-            "Manatoba": "MB",  # Fix spelling error
-            "Alberta": "AB", "Saskatchewan": "SK", "Quebec": "QC",
-            "Newfoundland": "NL", "New Brunswick": "NB", "Nova Scotia": "NS", 
-            "Prince Edward Island": "PE", "Yukon": "YT", "Northwest Territories": "NT",
-            "Nunavut": "NU"
-        }
-        if state in canadian_provinces and (country is None or country == ""):
-            standardized_province = canadian_provinces[state]
+        if state in CANADIAN_PROVINCES and (country is None or country == ""):
+            standardized_province = CANADIAN_PROVINCES[state]
             show_data["state"] = standardized_province
             show_data["country"] = "Canada"
             # Also standardize location_raw
@@ -334,10 +343,7 @@ class JerryGarciaShowIntegrator:
             self.logger.debug(f"Fixed Canadian province for {venue}: '{state}' → '{standardized_province}', country to 'Canada'")
         
         # Fix 6: International countries incorrectly in state field
-        countries_in_state = [
-            "Netherlands", "Luxembourg", "France", "England", "Egypt", "Denmark"
-        ]
-        if state in countries_in_state and (country is None or country == ""):
+        if state in COUNTRIES_IN_STATE_FIELD and (country is None or country == ""):
             show_data["state"] = None
             show_data["country"] = state
             self.logger.debug(f"Fixed international venue for {venue}: moved '{state}' from state to country field")
@@ -686,7 +692,7 @@ class JerryGarciaShowIntegrator:
     
     def process_integration(self) -> bool:
         """Process the complete integration."""
-        start_time = datetime.now()
+        start_time = time.perf_counter()
         
         # Load recording ratings if provided
         if not self.load_recordings_data():
@@ -700,7 +706,7 @@ class JerryGarciaShowIntegrator:
             return False
         
         # Report processing time
-        processing_time = (datetime.now() - start_time).total_seconds()
+        processing_time = time.perf_counter() - start_time
         self.logger.info(f"✅ Integration completed in {processing_time:.1f} seconds")
         
         # Summary
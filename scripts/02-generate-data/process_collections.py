@@ -44,6 +44,7 @@ class CollectionProcessor:
         # Collections data
         self.collections_data = None
         self.show_files = {}  # Map of date -> show_id for fast lookup
+        self.show_dates = {}  # Map of date string -> parsed date, parsed once for range checks
         
         # Setup logging
         self._setup_logging()
@@ -104,6 +105,10 @@ class CollectionProcessor:
                     # Handle multiple shows per date
                     if show_date not in self.show_files:
                         self.show_files[show_date] = []
+                        try:
+                            self.show_dates[show_date] = datetime.strptime(show_date, '%Y-%m-%d').date()
+                        except ValueError:
+                            self.logger.warning(f"⚠️ Invalid show date {show_date} in {show_file}, excluded from date ranges")
                     self.show_files[show_date].append({
                         'show_id': show_id,
                         'file_path': show_file,
@@ -141,10 +146,9 @@ class CollectionProcessor:
             start_date = datetime.strptime(range_def['start'], '%Y-%m-%d').date()
             end_date = datetime.strptime(range_def['end'], '%Y-%m-%d').date()
             
-            for date_str, shows in self.show_files.items():
-                show_date = datetime.strptime(date_str, '%Y-%m-%d').date()
+            for date_str, show_date in self.show_dates.items():
                 if start_date <= show_date <= end_date:
-                    for show in shows:
+                    for show in self.show_files[date_str]:
                         matched_shows.add(show['show_id'])
         
         # Handle additional dates
@@ -166,10 +170,9 @@ class CollectionProcessor:
                 start_date = datetime.strptime(exclusion['from'], '%Y-%m-%d').date()
                 end_date = datetime.strptime(exclusion['to'], '%Y-%m-%d').date()
                 
-                for date_str, shows in self.show_files.items():
-                    show_date = datetime.strptime(date_str, '%Y-%m-%d').date()
+                for date_str, show_date in self.show_dates.items():
                     if start_date <= show_date <= end_date:
-                        for show in shows:
+                        for show in self.show_files[date_str]:
                             matched_shows.discard(show['show_id'])
         
         return matched_shows
@@ -415,13 +418,9 @@ class CollectionProcessor:
                 start_dt = datetime.strptime(start_date, '%Y-%m-%d').date()
                 end_dt = datetime.strptime(end_date, '%Y-%m-%d').date()
                 
-                for date_str, shows in self.show_files.items():
-                    try:
-                        show_date = datetime.strptime(date_str, '%Y-%m-%d').date()
-                        if start_dt <= show_date <= end_dt:
-                            range_shows.extend([show['show_id'] for show in shows])
-                    except ValueError:
-                        continue
+                for date_str, show_date in self.show_dates.items():
+                    if start_dt <= show_date <= end_dt:
+                        range_shows.extend([show['show_id'] for show in self.show_files[date_str]])
                         
             except ValueError:
                 failure_info['suggestions'].append(f"Invalid date format in range: {start_date} to {end_date}")
@@ -16,9 +16,19 @@ import json
 import os
 import sys
 from collections import defaultdict, Counter
+from functools import lru_cache
 from pathlib import Path
 import re
 
+# Optional: faster JSON parsing and serialization
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Search key punctuation pattern, compiled once
+_PUNCTUATION_RE = re.compile(r"[^\w\s\-']")
+
 
 def load_show_files(shows_dir):
     """Load all show JSON files from the shows directory."""
@@ -31,17 +41,25 @@ def load_show_files(shows_dir):
     
     for show_file in shows_path.glob("*.json"):
         try:
-            with open(show_file, 'r', encoding='utf-8') as f:
-                show_data = json.load(f)
-                shows.append(show_data)
+            if orjson is not None:
+                show_data = orjson.loads(show_file.read_bytes())
+            else:
+                with open(show_file, 'r', encoding='utf-8') as f:
+                    show_data = json.load(f)
+            shows.append(show_data)
         except Exception as e:
             print(f"Warning: Could not load {show_file}: {e}")
     
     return shows
 
 
+@lru_cache(maxsize=65536)
 def normalize_search_key(text):
-    """Convert text to normalized search key."""
+    """
+    Convert text to normalized search key.
+    
+    Cached: the same song, venue and member names recur across thousands of shows.
+    """
     if not text:
         return ""
     
@@ -49,13 +67,10 @@ def normalize_search_key(text):
     normalized = text.lower()
     
     # Remove punctuation except hyphens and apostrophes
-    normalized = re.sub(r"[^\w\s\-']", '', normalized)
-    
-    # Normalize whitespace
-    normalized = re.sub(r'\s+', ' ', normalized).strip()
+    normalized = _PUNCTUATION_RE.sub('', normalized)
     
-    # Convert spaces to hyphens for keys
-    normalized = normalized.replace(' ', '-')
+    # Normalize whitespace and convert spaces to hyphens for keys
+    normalized = '-'.join(normalized.split())
     
     return normalized
 
@@ -166,11 +181,7 @@ def generate_songs_table(shows, verbose=False):
     
     # Track song performance data
     song_performances = defaultdict(list)
-    song_stats = defaultdict(lambda: {
-        'first_performance': None,
-        'last_performance': None,
-        'total_performances': 0
-    })
+    song_names = defaultdict(Counter)
     
     for show in shows:
         if not show.get('setlist'):
@@ -213,32 +224,13 @@ def generate_songs_table(shows, verbose=False):
                 }
                 
                 song_performances[song_key].append(performance)
-                
-                # Update stats
-                stats = song_stats[song_key]
-                stats['total_performances'] += 1
-                
-                if stats['first_performance'] is None or date < stats['first_performance']:
-                    stats['first_performance'] = date
-                if stats['last_performance'] is None or date > stats['last_performance']:
-                    stats['last_performance'] = date
+                song_names[song_key][song.get('name', '')] += 1
     
     # Build final songs table
     for song_key, performances in song_performances.items():
         # Find the canonical song name (most common version)
-        name_counter = Counter()
-        for perf in performances:
-            # Extract original name from the show data
-            for show in shows:
-                if show.get('show_id') == perf['show_id'] and show.get('setlist'):
-                    for set_info in show['setlist']:
-                        for song in set_info.get('songs', []):
-                            if normalize_search_key(song.get('name', '')) == song_key:
-                                name_counter[song.get('name', '')] += 1
-                                break
-        
+        name_counter = song_names[song_key]
         canonical_name = name_counter.most_common(1)[0][0] if name_counter else song_key
-        stats = song_stats[song_key]
         
         # Get aliases (use predefined or generate basic ones)
         aliases = song_aliases.get(song_key, [song_key])
@@ -249,9 +241,9 @@ def generate_songs_table(shows, verbose=False):
         songs_table[song_key] = {
             'name': canonical_name,
             'shows': performances,
-            'total_performances': stats['total_performances'],
-            'first_performance': stats['first_performance'],
-            'last_performance': stats['last_performance'],
+            'total_performances': len(performances),
+            'first_performance': performances[0]['date'],
+            'last_performance': performances[-1]['date'],
             'aliases': aliases
         }
     
@@ -356,6 +348,7 @@ def generate_members_table(shows, verbose=False):
     # Track member show data
     member_shows = defaultdict(list)
     member_instruments = defaultdict(set)
+    member_names = defaultdict(Counter)
     
     for show in shows:
         if not show.get('lineup'):
@@ -391,19 +384,12 @@ def generate_members_table(shows, verbose=False):
             }
             
             member_shows[member_key].append(show_data)
+            member_names[member_key][member.get('name', '')] += 1
     
     # Build final members table
     for member_key, shows_list in member_shows.items():
         # Find canonical name
-        name_counter = Counter()
-        for show_data in shows_list:
-            for show in shows:
-                if show.get('show_id') == show_data['show_id'] and show.get('lineup'):
-                    for member in show['lineup']:
-                        if normalize_search_key(member.get('name', '')) == member_key:
-                            name_counter[member.get('name', '')] += 1
-                            break
-        
+        name_counter = member_names[member_key]
         canonical_name = name_counter.most_common(1)[0][0] if name_counter else member_key
         
         # Sort shows by date
@@ -570,8 +556,11 @@ def main():
     total_size = 0
     for filename, table_data in tables.items():
         output_path = output_dir / filename
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(table_data, f, indent=2, ensure_ascii=False)
+        if orjson is not None:
+            output_path.write_bytes(orjson.dumps(table_data, option=orjson.OPT_INDENT_2))
+        else:
+            with open(output_path, 'w', encoding='utf-8') as f:
+                json.dump(table_data, f, indent=2, ensure_ascii=False)
         
         file_size = output_path.stat().st_size
         total_size += file_size
@@ -10,6 +10,7 @@ Usage:
     python scripts/package_datazip.py --verbose --analyze
 """
 
+import io
 import json
 import os
 import sys
@@ -18,8 +19,185 @@ from datetime import datetime
 from pathlib import Path
 import argparse
 import logging
+import platform
 import subprocess
 import re
+import struct
+import time
+import zlib
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+# Maximum files read and compressed ahead of the zip writer
+MAX_PENDING_MEMBERS = 64
+
+# Member compression methods by CLI name (zstd needs zipfile.ZIP_ZSTANDARD, Python 3.14+)
+COMPRESSION_METHODS = {
+    'store': zipfile.ZIP_STORED,
+    'deflate': zipfile.ZIP_DEFLATED,
+    'zstd': getattr(zipfile, 'ZIP_ZSTANDARD', None)
+}
+
+# Valid --compresslevel values by method (store ignores the level)
+COMPRESSION_LEVELS = {
+    'store': None,
+    'deflate': range(0, 10),
+    'zstd': range(1, 23)
+}
+
+# Stage 3 search files and their analysis keys
+SEARCH_FILES = {
+    'shows_index.json': 'shows_search',
+    'collections.json': 'collections_search',
+    'venues.json': 'venues_search',
+    'songs.json': 'songs_search',
+    'members.json': 'members_search'
+}
+
+# Highest zlib level that ISA-L deflate (at its level 1) stands in for
+ISAL_MAX_ZLIB_LEVEL = 3
+
+# JSON files above this size are stream-counted with ijson rather than
+# parsed whole; below it a full parse is faster and memory is not a concern
+STREAM_COUNT_THRESHOLD = 256 * 1024 * 1024
+
+# Semantic version: MAJOR.MINOR.PATCH with optional pre-release and build metadata
+_SEMVER_RE = re.compile(r'^(\d+)\.(\d+)\.(\d+)(?:-([0-9A-Za-z-]+(?:\.[0-9A-Za-z-]+)*))?(?:\+([0-9A-Za-z-]+(?:\.[0-9A-Za-z-]+)*))?$')
+
+# Optional: stream-count very large JSON files instead of loading them
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# Optional: faster JSON parsing and serialization
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Optional: ISA-L accelerated deflate for fast member compression levels
+try:
+    from isal import isal_zlib
+except ImportError:
+    isal_zlib = None
+
+
+def _loads_json(data):
+    """Parse JSON from bytes or str, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _dumps_json(obj, pretty: bool = False) -> bytes:
+    """Serialize to UTF-8 JSON bytes, compact or indented by 2, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if pretty else 0)
+    if pretty:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def _count_json_entries(file_path: Path, key: str = None) -> int:
+    """
+    Count the entries of a JSON file's top-level object or array, or of one
+    of its top-level keys.
+    
+    Files are normally parsed whole, which is faster than streaming since
+    ijson handles every parse event in Python. Only files larger than
+    STREAM_COUNT_THRESHOLD are streamed with ijson (when installed) so they
+    never get built in memory.
+    """
+    if ijson is None or file_path.stat().st_size <= STREAM_COUNT_THRESHOLD:
+        data = _loads_json(file_path.read_bytes())
+        if key is not None:
+            data = data.get(key, [])
+        return len(data)
+    
+    prefix = key or ''
+    item_prefix = f"{key}.item" if key else 'item'
+    container = None
+    count = 0
+    
+    with open(file_path, 'rb') as f:
+        for event_prefix, event, _ in ijson.parse(f):
+            if container is None:
+                if event_prefix == prefix and event in ('start_map', 'start_array'):
+                    container = event
+                continue
+            
+            if event_prefix == prefix and event in ('end_map', 'end_array'):
+                break
+            if container == 'start_map' and event == 'map_key' and event_prefix == prefix:
+                count += 1
+            elif container == 'start_array' and event_prefix == item_prefix and event not in ('map_key', 'end_map', 'end_array'):
+                count += 1
+    
+    return count
+
+
+def _zipfile_internals_available() -> bool:
+    """
+    Check for the zipfile internals used to append pre-compressed members
+    and copy raw members from a previous package.
+    
+    They are CPython implementation details with no public equivalent, so
+    a Python upgrade may change them; probe once at startup on a throwaway
+    archive instead of failing mid-build.
+    """
+    module_names = ('_get_compressor', 'structFileHeader', 'sizeFileHeader', 'stringFileHeader',
+                    '_FH_SIGNATURE', '_FH_FILENAME_LENGTH', '_FH_EXTRA_FIELD_LENGTH')
+    if not all(hasattr(zipfile, name) for name in module_names):
+        return False
+    if not hasattr(zipfile.ZipInfo, 'FileHeader'):
+        return False
+    with zipfile.ZipFile(io.BytesIO(), 'w') as probe:
+        return all(hasattr(probe, name) for name in ('fp', 'start_dir', '_writecheck', '_didModify'))
+
+
+# Members are compressed in worker threads and appended raw when zipfile's
+# internals allow it; otherwise they go through the public writestr API
+RAW_MEMBER_IO = _zipfile_internals_available()
+
+
+def _use_isal(compress_type: int, compresslevel: int = None) -> bool:
+    """
+    Check whether a member should be deflated with ISA-L instead of zlib.
+    
+    Only zlib levels up to ISAL_MAX_ZLIB_LEVEL qualify, where ISA-L level 1
+    is both faster and smaller. Higher levels, and so release builds, keep
+    stdlib zlib, whose output does not depend on optional packages.
+    """
+    return (isal_zlib is not None and compress_type == zipfile.ZIP_DEFLATED
+            and compresslevel is not None and 1 <= compresslevel <= ISAL_MAX_ZLIB_LEVEL)
+
+
+def _compress_file(source_path: Path, compress_type: int, compresslevel: int = None) -> tuple:
+    """
+    Read a file and compress it into a zip member payload.
+    
+    Runs in worker threads: zlib releases the GIL while deflating, so files
+    compress in parallel while the main thread appends finished members.
+    Fast deflate levels use ISA-L when isal is installed, which is several
+    times faster than zlib. Files that don't shrink are stored instead.
+    
+    Without RAW_MEMBER_IO the file is only read here and the payload is the
+    uncompressed data, which zipfile compresses when the member is written.
+    
+    Returns (compress_type, crc32, uncompressed size, payload).
+    """
+    data = source_path.read_bytes()
+    if not RAW_MEMBER_IO:
+        return compress_type, zlib.crc32(data), len(data), data
+    if _use_isal(compress_type, compresslevel):
+        compressor = isal_zlib.compressobj(1, zlib.DEFLATED, -15)
+    else:
+        compressor = zipfile._get_compressor(compress_type, compresslevel)
+    payload = compressor.compress(data) + compressor.flush() if compressor else data
+    if len(payload) >= len(data):
+        compress_type, payload = zipfile.ZIP_STORED, data
+    return compress_type, zlib.crc32(data), len(data), payload
 
 
 class DataPackager:
@@ -38,19 +216,54 @@ class DataPackager:
                  output_file: str = "data.zip",
                  version: str = None,
                  auto_version: bool = False,
-                 dev_build: bool = False):
+                 dev_build: bool = False,
+                 store_threshold: int = 0,
+                 bundle_recordings: bool = False,
+                 incremental: bool = False,
+                 compresslevel: int = None):
         """Initialize the data packager."""
         self.stage2_dir = Path(stage2_dir)
         self.stage3_dir = Path(stage3_dir)
         
+        # Files smaller than this many bytes are stored without compression
+        self.store_threshold = store_threshold
+        
+        # Pack recordings into one NDJSON member instead of one member per file
+        self.bundle_recordings = bundle_recordings
+        
+        # Reuse compressed members from the previous package for unchanged files
+        self.incremental = incremental
+        
+        # Git state is read once and shared by versioning and the manifest
+        self._git_info = None
+        
+        # Build host for the manifest
+        self.build_host = os.uname().nodename if hasattr(os, 'uname') else (platform.node() or 'unknown')
+        
         # Version detection and output file naming
         self.version = self._detect_version(version, auto_version, dev_build)
         self.output_file = self._determine_output_file(output_file, auto_version or dev_build)
         
+        # Compression level: fast for development builds, smallest for releases
+        if compresslevel is None:
+            compresslevel = 1 if "dev-" in self.version else 9
+        self.compresslevel = compresslevel
+        
         # Package contents tracking
         self.included_files = []
         self.package_stats = {}
         
+        # Directory listings and file stats shared by analysis and packaging
+        self._json_files = {}
+        self._file_stats = {}
+        
+        # Incremental build state: sidecar cache of member source stats, the
+        # previous package opened for reading, and stats for this build
+        self.cache_file = self.output_file.with_name(f".{self.output_file.name}.cache.json")
+        self._previous_zip = None
+        self._previous_stats = {}
+        self._member_stats = {}
+        
         # Setup logging
         self._setup_logging()
     
@@ -86,57 +299,48 @@ class DataPackager:
     
     def _validate_semver(self, version: str) -> bool:
         """Validate semantic version format (MAJOR.MINOR.PATCH)."""
-        semver_pattern = r'^(\d+)\.(\d+)\.(\d+)(?:-([0-9A-Za-z-]+(?:\.[0-9A-Za-z-]+)*))?(?:\+([0-9A-Za-z-]+(?:\.[0-9A-Za-z-]+)*))?$'
-        return bool(re.match(semver_pattern, version))
+        return bool(_SEMVER_RE.match(version))
     
-    def _get_git_tag(self) -> str:
-        """Get current git tag if available."""
-        try:
-            result = subprocess.run(
-                ['git', 'describe', '--tags', '--exact-match', 'HEAD'], 
-                capture_output=True, text=True, check=True
-            )
-            return result.stdout.strip()
-        except (subprocess.CalledProcessError, FileNotFoundError):
-            return None
-    
-    def _get_git_commit_hash(self) -> str:
-        """Get short git commit hash."""
-        try:
-            result = subprocess.run(
-                ['git', 'rev-parse', '--short', 'HEAD'], 
-                capture_output=True, text=True, check=True
-            )
-            return result.stdout.strip()
-        except (subprocess.CalledProcessError, FileNotFoundError):
-            return None
-    
-    def _get_git_metadata(self) -> dict:
-        """Get additional git metadata for manifest."""
-        metadata = {}
+    def _load_git_info(self) -> dict:
+        """
+        Load git commit, branch, tag and working tree state.
         
-        # Full commit hash
-        try:
-            result = subprocess.run(
-                ['git', 'rev-parse', 'HEAD'], 
-                capture_output=True, text=True, check=True
-            )
-            metadata['commit'] = result.stdout.strip()
-        except:
-            metadata['commit'] = None
+        Runs one `git log` for refs and hashes plus one `git status`, and caches
+        the result so versioning and manifest creation never spawn git again.
+        """
+        if self._git_info is not None:
+            return self._git_info
+        
+        git_info = {
+            'commit': None,
+            'short_commit': None,
+            'branch': None,
+            'tag': None,
+            'clean': None
+        }
         
-        # Branch name
+        # Full hash, short hash and ref names pointing at HEAD
         try:
             result = subprocess.run(
-                ['git', 'branch', '--show-current'], 
+                ['git', '-c', 'log.showSignature=false', 'log', '-1', '--decorate=short',
+                 '--format=%H%n%h%n%D', 'HEAD'],
                 capture_output=True, text=True, check=True
             )
-            metadata['branch'] = result.stdout.strip()
-        except:
-            metadata['branch'] = None
-        
-        # Tag (if any)
-        metadata['tag'] = self._get_git_tag()
+            lines = result.stdout.splitlines()
+            git_info['commit'] = lines[0].strip() if len(lines) > 0 else None
+            git_info['short_commit'] = lines[1].strip() if len(lines) > 1 else None
+            
+            # Refs look like "HEAD -> main, tag: v2.1.0, origin/main"
+            git_info['branch'] = ''
+            refs = lines[2].split(', ') if len(lines) > 2 and lines[2].strip() else []
+            for ref in refs:
+                ref = ref.strip()
+                if ref.startswith('HEAD -> '):
+                    git_info['branch'] = ref[len('HEAD -> '):]
+                elif ref.startswith('tag: ') and not git_info['tag']:
+                    git_info['tag'] = ref[len('tag: '):]
+        except (subprocess.CalledProcessError, FileNotFoundError):
+            pass
         
         # Check if working directory is clean
         try:
@@ -144,11 +348,30 @@ class DataPackager:
                 ['git', 'status', '--porcelain'], 
                 capture_output=True, text=True, check=True
             )
-            metadata['clean'] = len(result.stdout.strip()) == 0
-        except:
-            metadata['clean'] = None
+            git_info['clean'] = len(result.stdout.strip()) == 0
+        except (subprocess.CalledProcessError, FileNotFoundError):
+            pass
         
-        return metadata
+        self._git_info = git_info
+        return git_info
+    
+    def _get_git_tag(self) -> str:
+        """Get current git tag if available."""
+        return self._load_git_info()['tag']
+    
+    def _get_git_commit_hash(self) -> str:
+        """Get short git commit hash."""
+        return self._load_git_info()['short_commit']
+    
+    def _get_git_metadata(self) -> dict:
+        """Get additional git metadata for manifest."""
+        git_info = self._load_git_info()
+        return {
+            'commit': git_info['commit'],
+            'branch': git_info['branch'],
+            'tag': git_info['tag'],
+            'clean': git_info['clean']
+        }
     
     def _determine_output_file(self, output_file: str, use_versioned_name: bool) -> Path:
         """Determine the output filename based on versioning preferences."""
@@ -165,6 +388,55 @@ class DataPackager:
         # Default behavior
         return output_path
     
+    def _list_json_files(self, directory: Path) -> list:
+        """
+        List JSON files in a directory, scanning each directory once per run.
+        
+        Uses a single os.scandir pass and caches each file's stat result so
+        later size and timestamp lookups don't hit the filesystem again.
+        """
+        if directory not in self._json_files:
+            json_files = []
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if not entry.name.endswith('.json'):
+                        continue
+                    file_path = directory / entry.name
+                    self._file_stats[file_path] = entry.stat()
+                    json_files.append(file_path)
+            self._json_files[directory] = json_files
+        return self._json_files[directory]
+    
+    def _file_stat(self, file_path: Path) -> os.stat_result:
+        """Get a file's stat, using the cached result from the directory scan when available."""
+        if file_path not in self._file_stats:
+            self._file_stats[file_path] = file_path.stat()
+        return self._file_stats[file_path]
+    
+    def _exists(self, file_path: Path) -> bool:
+        """Check that a path exists, caching its stat for later size and timestamp lookups."""
+        try:
+            self._file_stat(file_path)
+            return True
+        except FileNotFoundError:
+            return False
+    
+    def _file_size(self, file_path: Path) -> int:
+        """Get a file's size, using the cached stat from the directory scan when available."""
+        return self._file_stat(file_path).st_size
+    
+    def _zip_info(self, file_path: Path, archive_path: str) -> zipfile.ZipInfo:
+        """
+        Build a ZipInfo for a file from its cached stat.
+        
+        Equivalent to ZipInfo.from_file() for regular files, without the
+        extra os.stat() call per member.
+        """
+        st = self._file_stat(file_path)
+        zinfo = zipfile.ZipInfo(archive_path, time.localtime(st.st_mtime)[:6])
+        zinfo.external_attr = (st.st_mode & 0xFFFF) << 16
+        return zinfo
+    
     def _setup_logging(self):
         """Setup logging with console output."""
         self.logger = logging.getLogger(__name__)
@@ -184,6 +456,16 @@ class DataPackager:
         # Add handler
         self.logger.addHandler(console_handler)
     
+    def _find_missing_files(self) -> list:
+        """List the expected Stage 2 and Stage 3 inputs that do not exist."""
+        expected = [
+            self.stage2_dir / "collections.json",
+            self.stage2_dir / "recordings",
+            self.stage2_dir / "shows"
+        ]
+        expected += [self.stage3_dir / filename for filename in SEARCH_FILES]
+        return [str(path) for path in expected if not self._exists(path)]
+    
     def analyze_data_structure(self) -> dict:
         """
         Analyze the available data structure and calculate statistics.
@@ -195,7 +477,7 @@ class DataPackager:
             'stage2_data': {},
             'stage3_data': {},
             'totals': {},
-            'missing_files': []
+            'missing_files': self._find_missing_files()
         }
         
         # Analyze Stage 2 data
@@ -203,20 +485,16 @@ class DataPackager:
         
         # Collections data
         collections_file = self.stage2_dir / "collections.json"
-        if collections_file.exists():
-            with open(collections_file, 'r', encoding='utf-8') as f:
-                collections_data = json.load(f)
-                analysis['stage2_data']['collections'] = {
-                    'total_collections': len(collections_data.get('collections', [])),
-                    'file_size': collections_file.stat().st_size
-                }
-        else:
-            analysis['missing_files'].append(str(collections_file))
+        if self._exists(collections_file):
+            analysis['stage2_data']['collections'] = {
+                'total_collections': _count_json_entries(collections_file, 'collections'),
+                'file_size': self._file_size(collections_file)
+            }
         
         # Recording data with track metadata (individual files)
         recordings_dir = self.stage2_dir / "recordings"
-        if recordings_dir.exists():
-            recording_files = list(recordings_dir.glob("*.json"))
+        if self._exists(recordings_dir):
+            recording_files = self._list_json_files(recordings_dir)
             total_tracks = 0
             total_file_size = 0
             
@@ -224,10 +502,8 @@ class DataPackager:
             sample_files = recording_files[:10] if len(recording_files) > 10 else recording_files
             for sample_file in sample_files:
                 try:
-                    with open(sample_file, 'r', encoding='utf-8') as f:
-                        recording_data = json.load(f)
-                        total_tracks += len(recording_data.get('tracks', []))
-                        total_file_size += sample_file.stat().st_size
+                    total_tracks += _count_json_entries(sample_file, 'tracks')
+                    total_file_size += self._file_size(sample_file)
                 except Exception:
                     continue
             
@@ -247,43 +523,27 @@ class DataPackager:
                 'total_files': len(recording_files),
                 'estimated_size': estimated_total_size
             }
-        else:
-            analysis['missing_files'].append(str(recordings_dir))
         
         # Show files
         shows_dir = self.stage2_dir / "shows"
-        if shows_dir.exists():
-            show_files = list(shows_dir.glob("*.json"))
+        if self._exists(shows_dir):
+            show_files = self._list_json_files(shows_dir)
             analysis['stage2_data']['shows'] = {
                 'total_shows': len(show_files),
-                'directory_size': sum(f.stat().st_size for f in show_files)
+                'directory_size': sum(self._file_size(f) for f in show_files)
             }
-        else:
-            analysis['missing_files'].append(str(shows_dir))
         
         # Analyze Stage 3 search data
         self.logger.info("🔍 Analyzing Stage 3 search data...")
         
-        search_files = {
-            'shows_index.json': 'shows_search',
-            'collections.json': 'collections_search', 
-            'venues.json': 'venues_search',
-            'songs.json': 'songs_search',
-            'members.json': 'members_search'
-        }
-        
         analysis['stage3_data'] = {}
-        for filename, key in search_files.items():
+        for filename, key in SEARCH_FILES.items():
             file_path = self.stage3_dir / filename
-            if file_path.exists():
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    analysis['stage3_data'][key] = {
-                        'total_entries': len(data),
-                        'file_size': file_path.stat().st_size
-                    }
-            else:
-                analysis['missing_files'].append(str(file_path))
+            if self._exists(file_path):
+                analysis['stage3_data'][key] = {
+                    'total_entries': _count_json_entries(file_path),
+                    'file_size': self._file_size(file_path)
+                }
         
         # Calculate totals
         total_size = 0
@@ -319,13 +579,16 @@ class DataPackager:
         # Determine version type
         version_type = "development" if "dev-" in self.version else "release"
         
+        # One timestamp for both creation and build time
+        build_timestamp = datetime.now().isoformat()
+        
         manifest = {
             'package': {
                 'name': 'Dead Archive Metadata',
                 'version': self.version,
                 'version_type': version_type,
                 'description': 'Complete Grateful Dead concert metadata with track-level data and search optimization',
-                'created': datetime.now().isoformat(),
+                'created': build_timestamp,
                 'generator': 'dead-metadata pipeline v3.0'
             },
             'build_info': {
@@ -333,8 +596,8 @@ class DataPackager:
                 'git_branch': git_metadata.get('branch'),
                 'git_tag': git_metadata.get('tag'),
                 'git_clean': git_metadata.get('clean'),
-                'build_timestamp': datetime.now().isoformat(),
-                'build_host': os.uname().nodename if hasattr(os, 'uname') else 'unknown'
+                'build_timestamp': build_timestamp,
+                'build_host': self.build_host
             },
             'contents': {
                 'stage2_data': {
@@ -369,74 +632,291 @@ class DataPackager:
             }
         }
         
+        if self.bundle_recordings:
+            stage2_files = manifest['contents']['stage2_data']['files']
+            del stage2_files['recordings/']
+            stage2_files['recordings.ndjson'] = 'All recordings with track-level data and ratings, one JSON object per line'
+            stage2_files['recordings_index.json'] = 'Recording identifier to [byte offset, length] in recordings.ndjson'
+        
         return manifest
     
-    def package_data(self, compression_level: int = zipfile.ZIP_DEFLATED) -> bool:
+    def _write_member(self, zipf: zipfile.ZipFile, zinfo: zipfile.ZipInfo, payload: bytes):
+        """
+        Append a member produced by _compress_file to an open archive.
+        
+        zipfile has no public API for pre-compressed data, so this does what
+        ZipFile.open(..., 'w') does around its compressor: write the local
+        header and payload at the end of the archive, then register the entry
+        for the central directory. CRC and sizes must already be set on zinfo.
+        
+        Without RAW_MEMBER_IO the payload is uncompressed and is handed to
+        writestr, which compresses it with the member's method.
+        """
+        if not RAW_MEMBER_IO:
+            zipf.writestr(zinfo, payload, compress_type=zinfo.compress_type, compresslevel=zipf.compresslevel)
+            return
+        
+        zipf.fp.seek(zipf.start_dir)
+        zinfo.header_offset = zipf.fp.tell()
+        zipf._writecheck(zinfo)
+        zipf._didModify = True
+        zipf.fp.write(zinfo.FileHeader())
+        zipf.fp.write(payload)
+        zipf.start_dir = zipf.fp.tell()
+        zipf.filelist.append(zinfo)
+        zipf.NameToInfo[zinfo.filename] = zinfo
+    
+    def _add_file(self, zipf: zipfile.ZipFile, source_path: Path, archive_path: str):
+        """Compress and append a single file, building its ZipInfo from the cached stat."""
+        compress_type, crc, file_size, payload = _compress_file(source_path, zipf.compression, zipf.compresslevel)
+        zinfo = self._zip_info(source_path, archive_path)
+        zinfo.compress_type = compress_type
+        zinfo.CRC = crc
+        zinfo.file_size = file_size
+        zinfo.compress_size = len(payload)
+        self._write_member(zipf, zinfo, payload)
+    
+    def _member_compression(self, zipf: zipfile.ZipFile, source_path: Path) -> int:
+        """Choose the compression method for a file, storing files below the store threshold."""
+        if self.store_threshold and self._file_size(source_path) < self.store_threshold:
+            return zipfile.ZIP_STORED
+        return zipf.compression
+    
+    def _open_previous_package(self, compresslevel):
+        """
+        Move the previous package aside and open it for member reuse.
+        
+        Reuse needs both the previous archive and its stat cache, built with
+        the same compression settings. The cache records the package's mtime
+        and size, so an archive rewritten by any other build is never reused.
+        Anything unreadable just disables reuse.
+        """
+        if not (self.output_file.exists() and self.cache_file.exists()):
+            return
+        
+        if not RAW_MEMBER_IO:
+            self.logger.warning("⚠️ zipfile internals unavailable, rebuilding all members")
+            return
+        
+        previous_file = self.output_file.with_name(f"{self.output_file.name}.prev")
+        try:
+            cache = _loads_json(self.cache_file.read_bytes())
+            if not isinstance(cache, dict):
+                raise ValueError("cache is not a JSON object")
+            
+            st = self.output_file.stat()
+            if cache.get('package') != [st.st_mtime_ns, st.st_size]:
+                self.logger.info("♻️ Package changed since the cache was written, rebuilding all members")
+                return
+            
+            if cache.get('compresslevel') != compresslevel or cache.get('store_threshold') != self.store_threshold:
+                self.logger.info("♻️ Compression settings changed, rebuilding all members")
+                return
+            
+            # Check the old archive in place so a corrupt one is never moved aside
+            with zipfile.ZipFile(self.output_file):
+                pass
+            
+            os.replace(self.output_file, previous_file)
+            self._previous_zip = zipfile.ZipFile(previous_file)
+            self._previous_stats = cache.get('members', {})
+            self.logger.info(f"♻️ Reusing unchanged members from previous package ({len(self._previous_stats)} cached)")
+        except (OSError, ValueError, zipfile.BadZipFile) as e:
+            self.logger.warning(f"⚠️ Could not load previous package for reuse: {e}")
+            previous_file.unlink(missing_ok=True)
+    
+    def _close_previous_package(self):
+        """Close and delete the previous package once the new one is written."""
+        if self._previous_zip is not None:
+            previous_file = Path(self._previous_zip.filename)
+            self._previous_zip.close()
+            previous_file.unlink(missing_ok=True)
+            self._previous_zip = None
+    
+    def _previous_member(self, archive_path: str, source_path: Path, compress_type: int):
+        """
+        Get the previous package's entry for a member if its source is unchanged.
+        
+        A member is reused only when the source file's mtime and size match
+        the cache and the old entry used the same compression method, or was
+        stored because compressing it didn't shrink it.
+        """
+        if self._previous_zip is None:
+            return None
+        
+        st = self._file_stat(source_path)
+        if self._previous_stats.get(archive_path) != [st.st_mtime_ns, st.st_size]:
+            return None
+        
+        zinfo = self._previous_zip.NameToInfo.get(archive_path)
+        if zinfo is None or zinfo.compress_type not in (compress_type, zipfile.ZIP_STORED) or zinfo.file_size != st.st_size:
+            return None
+        return zinfo
+    
+    def _read_raw_member(self, zinfo: zipfile.ZipInfo) -> bytes:
+        """Read a member's compressed bytes from the previous package without decompressing."""
+        fp = self._previous_zip.fp
+        fp.seek(zinfo.header_offset)
+        fheader = struct.unpack(zipfile.structFileHeader, fp.read(zipfile.sizeFileHeader))
+        if fheader[zipfile._FH_SIGNATURE] != zipfile.stringFileHeader:
+            raise zipfile.BadZipFile(f"Bad local header for {zinfo.filename}")
+        fp.seek(fheader[zipfile._FH_FILENAME_LENGTH] + fheader[zipfile._FH_EXTRA_FIELD_LENGTH], os.SEEK_CUR)
+        return fp.read(zinfo.compress_size)
+    
+    def _add_files_parallel(self, zipf: zipfile.ZipFile, executor: ThreadPoolExecutor, files: list, archive_dir: str):
+        """
+        Compress files on the executor and append them to the archive in order.
+        
+        At most MAX_PENDING_MEMBERS files are read and compressed ahead of the
+        writer, which keeps every worker busy without holding the whole
+        compressed dataset in memory when writing falls behind.
+        
+        Yields each archive path as its member is written so callers can track
+        progress.
+        
+        In incremental builds, members whose source is unchanged are copied
+        from the previous package as-is instead of being recompressed.
+        """
+        def submit(source_path):
+            archive_path = f"{archive_dir}/{source_path.name}"
+            compress_type = self._member_compression(zipf, source_path)
+            previous = self._previous_member(archive_path, source_path, compress_type)
+            if previous is not None:
+                return archive_path, source_path, previous
+            future = executor.submit(_compress_file, source_path, compress_type, zipf.compresslevel)
+            return archive_path, source_path, future
+        
+        files_iter = iter(files)
+        pending = deque()
+        for source_path in files_iter:
+            pending.append(submit(source_path))
+            if len(pending) >= MAX_PENDING_MEMBERS:
+                break
+        
+        while pending:
+            archive_path, source_path, job = pending.popleft()
+            next_path = next(files_iter, None)
+            if next_path is not None:
+                pending.append(submit(next_path))
+            
+            if isinstance(job, zipfile.ZipInfo):
+                compress_type, crc, file_size = job.compress_type, job.CRC, job.file_size
+                payload = self._read_raw_member(job)
+            else:
+                compress_type, crc, file_size, payload = job.result()
+            
+            zinfo = self._zip_info(source_path, archive_path)
+            zinfo.compress_type = compress_type
+            zinfo.CRC = crc
+            zinfo.file_size = file_size
+            zinfo.compress_size = len(payload)
+            self._write_member(zipf, zinfo, payload)
+            
+            st = self._file_stat(source_path)
+            self._member_stats[archive_path] = [st.st_mtime_ns, st.st_size]
+            yield archive_path
+    
+    def _add_recordings_bundle(self, zipf: zipfile.ZipFile, recording_files: list) -> int:
+        """
+        Write all recordings into a single NDJSON member plus an offset index.
+        
+        One deflate stream over every recording shares its dictionary across
+        files, so repeated keys compress far better than in 20k separate
+        members. recordings_index.json maps each recording identifier to the
+        [byte offset, length] of its line in the uncompressed recordings.ndjson.
+        
+        Returns the number of recordings written.
+        """
+        index = {}
+        offset = 0
+        
+        with zipf.open('recordings.ndjson', 'w', force_zip64=True) as bundle:
+            for recording_file in recording_files:
+                line = _dumps_json(_loads_json(recording_file.read_bytes())) + b'\n'
+                bundle.write(line)
+                index[recording_file.stem] = [offset, len(line)]
+                offset += len(line)
+                
+                if len(index) % 2000 == 0:
+                    self.logger.info(f"   📄 Bundled {len(index)}/{len(recording_files)} recording files...")
+        
+        zipf.writestr('recordings_index.json', _dumps_json(index))
+        self.included_files.extend(['recordings.ndjson', 'recordings_index.json'])
+        return len(index)
+    
+    def package_data(self, compression: int = zipfile.ZIP_DEFLATED, compresslevel: int = None) -> bool:
         """
         Create the final data package with all processed data.
         
+        compresslevel defaults to the packager's level for this build type.
         Returns True if successful, False otherwise.
         """
+        if compresslevel is None:
+            compresslevel = self.compresslevel
+        
         try:
-            # Analyze data first
-            analysis = self.analyze_data_structure()
-            
             # Check for missing critical files
-            if analysis['missing_files']:
-                self.logger.error(f"❌ Missing critical files: {analysis['missing_files']}")
+            missing_files = self._find_missing_files()
+            if missing_files:
+                self.logger.error(f"❌ Missing critical files: {missing_files}")
                 return False
             
-            # Create package manifest
-            manifest = self.create_package_manifest(analysis)
-            
             self.logger.info(f"📦 Creating package: {self.output_file}")
             self.logger.info(f"🏷️ Package version: {self.version}")
-            self.logger.info(f"📊 Total data: {analysis['totals']['total_size_mb']} MB across {analysis['totals']['total_files']} files")
+            self.logger.info(f"🗜️ Compression level: {compresslevel}")
+            if not RAW_MEMBER_IO:
+                self.logger.warning("⚠️ zipfile internals unavailable, compressing members through writestr")
+            elif _use_isal(compression, compresslevel):
+                self.logger.info("🗜️ Using ISA-L deflate (level 1)")
             
-            with zipfile.ZipFile(self.output_file, 'w', compression_level) as zipf:
-                
-                # Add manifest
-                manifest_json = json.dumps(manifest, indent=2, ensure_ascii=False)
-                zipf.writestr('manifest.json', manifest_json)
-                self.included_files.append('manifest.json')
+            if self.incremental:
+                self._open_previous_package(compresslevel)
+            else:
+                # The new package won't match a cache left by an earlier incremental build
+                self.cache_file.unlink(missing_ok=True)
+            
+            # Always write straight to the output path on disk. Members are
+            # appended through zipf.fp, and an in-memory buffer (BytesIO) grows
+            # by copying, which makes large archives dramatically slower.
+            with zipfile.ZipFile(self.output_file, 'w', compression=compression, compresslevel=compresslevel) as zipf, ThreadPoolExecutor() as executor:
                 
                 # Add Stage 2 generated data
                 self.logger.info("📁 Adding Stage 2 generated data...")
                 
                 # Collections
                 collections_file = self.stage2_dir / "collections.json"
-                if collections_file.exists():
-                    zipf.write(collections_file, 'collections.json')
+                if self._exists(collections_file):
+                    self._add_file(zipf, collections_file, 'collections.json')
                     self.included_files.append('collections.json')
                 
                 # Individual recording files with tracks
                 recordings_dir = self.stage2_dir / "recordings"
-                if recordings_dir.exists():
-                    recording_files = list(recordings_dir.glob("*.json"))
+                if self._exists(recordings_dir):
+                    recording_files = self._list_json_files(recordings_dir)
                     recording_count = 0
                     
-                    self.logger.info(f"   📄 Adding {len(recording_files)} individual recording files...")
-                    
-                    for recording_file in recording_files:
-                        archive_path = f"recordings/{recording_file.name}"
-                        zipf.write(recording_file, archive_path)
-                        self.included_files.append(archive_path)
-                        recording_count += 1
+                    if self.bundle_recordings:
+                        self.logger.info(f"   📄 Bundling {len(recording_files)} recording files into recordings.ndjson...")
+                        recording_count = self._add_recordings_bundle(zipf, recording_files)
+                    else:
+                        self.logger.info(f"   📄 Adding {len(recording_files)} individual recording files...")
                         
-                        if recording_count % 2000 == 0:
-                            self.logger.info(f"   📄 Added {recording_count}/{len(recording_files)} recording files...")
+                        for archive_path in self._add_files_parallel(zipf, executor, recording_files, "recordings"):
+                            self.included_files.append(archive_path)
+                            recording_count += 1
+                            
+                            if recording_count % 2000 == 0:
+                                self.logger.info(f"   📄 Added {recording_count}/{len(recording_files)} recording files...")
                     
                     self.logger.info(f"   ✅ Added {recording_count} recording files")
                 
                 # Individual show files
                 shows_dir = self.stage2_dir / "shows"
-                if shows_dir.exists():
-                    show_files = list(shows_dir.glob("*.json"))
+                if self._exists(shows_dir):
+                    show_files = self._list_json_files(shows_dir)
                     show_count = 0
                     
-                    for show_file in show_files:
-                        archive_path = f"shows/{show_file.name}"
-                        zipf.write(show_file, archive_path)
+                    for archive_path in self._add_files_parallel(zipf, executor, show_files, "shows"):
                         self.included_files.append(archive_path)
                         show_count += 1
                         
@@ -448,30 +928,39 @@ class DataPackager:
                 # Add Stage 3 search data
                 self.logger.info("📁 Adding Stage 3 search data...")
                 
-                search_files = [
-                    'shows_index.json',
-                    'collections.json', 
-                    'venues.json',
-                    'songs.json',
-                    'members.json'
-                ]
-                
-                for filename in search_files:
+                for filename in SEARCH_FILES:
                     source_file = self.stage3_dir / filename
-                    if source_file.exists():
+                    if self._exists(source_file):
                         archive_path = f"search/{filename}"
-                        zipf.write(source_file, archive_path)
+                        self._add_file(zipf, source_file, archive_path)
                         self.included_files.append(archive_path)
                         self.logger.info(f"   📄 Added {filename}")
                 
-                # Calculate final package stats
-                self.package_stats = {
-                    'total_files': len(self.included_files),
-                    'compressed_size': self.output_file.stat().st_size,
-                    'compression_ratio': round(
-                        (1 - self.output_file.stat().st_size / analysis['totals']['total_size_bytes']) * 100, 1
-                    )
-                }
+                # Add manifest last, once the listings and stats it summarizes are cached
+                analysis = self.analyze_data_structure()
+                manifest = self.create_package_manifest(analysis)
+                zipf.writestr('manifest.json', _dumps_json(manifest, pretty=True))
+                self.included_files.append('manifest.json')
+                self.logger.info(f"📊 Total data: {analysis['totals']['total_size_mb']} MB across {analysis['totals']['total_files']} files")
+                
+            # Calculate final package stats once the central directory is written
+            package_stat = self.output_file.stat()
+            compressed_size = package_stat.st_size
+            self.package_stats = {
+                'total_files': len(self.included_files),
+                'compressed_size': compressed_size,
+                'compression_ratio': round(
+                    (1 - compressed_size / analysis['totals']['total_size_bytes']) * 100, 1
+                )
+            }
+            
+            if self.incremental:
+                self.cache_file.write_bytes(_dumps_json({
+                    'package': [package_stat.st_mtime_ns, package_stat.st_size],
+                    'compresslevel': zipf.compresslevel,
+                    'store_threshold': self.store_threshold,
+                    'members': self._member_stats
+                }))
             
             self.logger.info(f"✅ Package created successfully!")
             self.logger.info(f"📊 Final package: {round(self.package_stats['compressed_size'] / (1024 * 1024), 2)} MB")
@@ -483,6 +972,9 @@ class DataPackager:
         except Exception as e:
             self.logger.error(f"❌ Packaging failed: {e}")
             return False
+        
+        finally:
+            self._close_previous_package()
     
     def validate_package(self) -> bool:
         """
@@ -501,14 +993,14 @@ class DataPackager:
                 # Check manifest
                 try:
                     manifest_data = zipf.read('manifest.json')
-                    manifest = json.loads(manifest_data.decode('utf-8'))
+                    manifest = _loads_json(manifest_data)
                     self.logger.info(f"✅ Manifest valid: {manifest['package']['name']} v{manifest['package']['version']}")
                 except Exception as e:
                     self.logger.error(f"❌ Invalid manifest: {e}")
                     return False
                 
                 # Check file list
-                files_in_package = zipf.namelist()
+                files_in_package = set(zipf.namelist())
                 expected_critical_files = [
                     'manifest.json',
                     'collections.json',
@@ -521,18 +1013,26 @@ class DataPackager:
                         self.logger.error(f"❌ Missing critical file: {critical_file}")
                         return False
                 
-                # Count show files
-                show_files = [f for f in files_in_package if f.startswith('shows/') and f.endswith('.json')]
-                self.logger.info(f"📄 Package contains {len(show_files)} show files")
+                # Count show and recording files in one pass, keeping the first of each as a sample
+                show_count = recording_count = 0
+                first_show = first_recording = None
+                for name in zipf.namelist():
+                    if not name.endswith('.json'):
+                        continue
+                    if name.startswith('shows/'):
+                        show_count += 1
+                        first_show = first_show or name
+                    elif name.startswith('recordings/'):
+                        recording_count += 1
+                        first_recording = first_recording or name
                 
-                # Count recording files
-                recording_files = [f for f in files_in_package if f.startswith('recordings/') and f.endswith('.json')]
-                self.logger.info(f"📄 Package contains {len(recording_files)} recording files")
+                self.logger.info(f"📄 Package contains {show_count} show files")
+                self.logger.info(f"📄 Package contains {recording_count} recording files")
                 
                 # Test read a sample show file
-                if show_files:
-                    sample_show = zipf.read(show_files[0])
-                    show_data = json.loads(sample_show.decode('utf-8'))
+                if first_show:
+                    sample_show = zipf.read(first_show)
+                    show_data = _loads_json(sample_show)
                     if 'show_id' in show_data and 'date' in show_data:
                         self.logger.info(f"✅ Show file format valid: {show_data['show_id']}")
                     else:
@@ -540,15 +1040,30 @@ class DataPackager:
                         return False
                 
                 # Test read a sample recording file
-                if recording_files:
-                    sample_recording = zipf.read(recording_files[0])
-                    recording_data = json.loads(sample_recording.decode('utf-8'))
+                if first_recording:
+                    sample_recording = zipf.read(first_recording)
+                    recording_data = _loads_json(sample_recording)
                     if 'rating' in recording_data and 'tracks' in recording_data:
                         self.logger.info(f"✅ Recording file format valid with {len(recording_data.get('tracks', []))} tracks")
                     else:
                         self.logger.error(f"❌ Invalid recording file format")
                         return False
                 
+                # Test read the first bundled recording
+                if 'recordings.ndjson' in files_in_package:
+                    recording_index = _loads_json(zipf.read('recordings_index.json'))
+                    self.logger.info(f"📄 Package contains {len(recording_index)} bundled recordings")
+                    
+                    with zipf.open('recordings.ndjson') as bundle:
+                        first_line = bundle.readline()
+                    if first_line:
+                        recording_data = _loads_json(first_line)
+                        if 'rating' in recording_data and 'tracks' in recording_data:
+                            self.logger.info(f"✅ Bundled recording format valid with {len(recording_data.get('tracks', []))} tracks")
+                        else:
+                            self.logger.error(f"❌ Invalid bundled recording format")
+                            return False
+                
                 self.logger.info(f"✅ Package validation successful!")
                 return True
                 
@@ -576,8 +1091,27 @@ def main():
     parser.add_argument('--dev-build', action='store_true',
                         help='Create development build with commit hash and timestamp')
     
+    # Compression options
+    parser.add_argument('--store-below', type=int, default=0, metavar='BYTES',
+                        help='Store recording and show files smaller than BYTES without compression')
+    parser.add_argument('--bundle-recordings', action='store_true',
+                        help='Pack recordings into a single recordings.ndjson member with an offset index')
+    parser.add_argument('--compress', choices=sorted(COMPRESSION_METHODS), default='deflate',
+                        help='Member compression method; store writes uncompressed. zstd requires Python 3.14+ '
+                             'and its members cannot be read by deflate-only zip readers such as java.util.zip, '
+                             'which the app uses')
+    parser.add_argument('--compresslevel', type=int, metavar='LEVEL',
+                        help='Compression level: 0-9 for deflate, 1-22 for zstd, ignored for store '
+                             '(default: 1 for development builds, 9 for releases)')
+    parser.add_argument('--incremental', action='store_true',
+                        help='Reuse compressed members from the previous package for unchanged files')
+    
     args = parser.parse_args()
     
+    levels = COMPRESSION_LEVELS[args.compress]
+    if args.compresslevel is not None and levels is not None and args.compresslevel not in levels:
+        parser.error(f"--compresslevel for {args.compress} must be {levels.start}-{levels.stop - 1}")
+    
     # Initialize packager
     packager = DataPackager(
         stage2_dir=args.stage2_dir,
@@ -585,7 +1119,11 @@ def main():
         output_file=args.output,
         version=args.version,
         auto_version=args.auto_version,
-        dev_build=args.dev_build
+        dev_build=args.dev_build,
+        store_threshold=args.store_below,
+        bundle_recordings=args.bundle_recordings,
+        incremental=args.incremental,
+        compresslevel=args.compresslevel
     )
     
     # Set logging level
@@ -612,7 +1150,12 @@ def main():
                 return 1
         
         # Full packaging process
-        if packager.package_data():
+        compression = COMPRESSION_METHODS[args.compress]
+        if compression is None:
+            packager.logger.error(f"❌ {args.compress} compression is not supported by this Python's zipfile module")
+            return 1
+        
+        if packager.package_data(compression=compression):
             # Validate the created package
             if packager.validate_package():
                 packager.logger.info("🎉 Data packaging completed successfully!")
@@ -7,6 +7,7 @@ This module contains reusable logic for source type detection, rating calculatio
 and other recording-related operations.
 """
 
+from functools import lru_cache
 from typing import Optional
 from .models import RecordingMetadata
 
@@ -76,12 +77,15 @@ def detect_recording_time(identifier: str) -> Optional[str]:
         return None
 
 
+@lru_cache(maxsize=4096)
 def normalize_venue_name(venue: str) -> str:
     """
     Normalize venue name for better matching between different data sources.
     
     This function standardizes common venue name variations to improve
-    matching accuracy when combining data from different sources.
+    matching accuracy when combining data from different sources. Results are
+    cached, since venue matching compares the same few names for every
+    recording on a date.
     
     Args:
         venue: Raw venue name string